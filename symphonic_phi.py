@@ -17,33 +17,59 @@ Contact: alpay@lightcap.ai
 
 import sys
 import argparse
+import functools
+import operator
+from bisect import bisect_right
+from itertools import accumulate
+
+
+# UTF-32 in native byte order, so cast('I') reads codepoints on any host;
+# surrogatepass keeps lone surrogates (valid str, e.g. from surrogateescape)
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
 
 class SymphonicPhiSystem:
+    # Fixed per-instance state: no __dict__, and attribute loads in the
+    # fold loop resolve through slot descriptors
+    __slots__ = ('signatures', 'fold_count', 'verbose',
+                 '_delta_half_chars', '_delta_half_len')
+    
+    # 10^digit_count for every digit_count the node compression can reach
+    _MOD_BASES = tuple(10**i for i in range(17))
+    # Every signature a fold produces, and the evolved ones curvature tracks
+    _NODE_KEYS = ('tau', 'omega', 'delta', 'epsilon', 'eta', 'kappa', 'zeta')
+    _CURV_KEYS = _NODE_KEYS[:5]
+    
     def __init__(self, verbose=False):
         """
         Initialize the φ system with minimal symbolic seeds.
         We'll track fold_count purely internally.
         'verbose' controls extra debug output.
         """
+        # Only the latest value of each signature is ever read back,
+        # so we keep that alone rather than every fold's string.
         self.signatures = {
-            'tau': ['τ'],      # Let τ "speak"
-            'omega': ['ω'],    # Let ω "fracture"
-            'delta': ['δ'],    # Let δ fold into κ
-            'epsilon': ['ε'],  # Track "entropy"
-            'eta': ['η'],      # Let η birth ζ
-            'kappa': [],
-            'zeta': []
+            'tau': 'τ',      # Let τ "speak"
+            'omega': 'ω',    # Let ω "fracture"
+            'delta': 'δ',    # Let δ fold into κ
+            'epsilon': 'ε',  # Track "entropy"
+            'eta': 'η',      # Let η birth ζ
+            'kappa': '',
+            'zeta': ''
         }
-        self.history = []
         self.fold_count = 0
         self.verbose = verbose
+        # Unique characters of δ's left half so far, and the prefix length
+        # of δ they cover (that prefix never changes between folds)
+        self._delta_half_chars = set()
+        self._delta_half_len = 0
     
     def fold(self, external_input=""):
         """
         Perform one symbolic fold. 
         Returns a dict containing:
           - fold_signatures: updated symbolic states
-          - curvature: measure of character changes
+          - curvature: per-signature count of changed characters
           - node: nXXXXX@alpay.md (with minimal leading zeros)
           - fold_count
           - (optional) debug info about expansions if verbose is True
@@ -52,11 +78,11 @@ class SymphonicPhiSystem:
         
         new_state = {}
         # 1) Evolve each main signature
-        new_state['tau']     = self._speak(self.signatures['tau'][-1], external_input)
-        new_state['omega']   = self._fracture(self.signatures['omega'][-1], external_input)
-        new_state['delta']   = self._fold_delta(self.signatures['delta'][-1], external_input)
-        new_state['epsilon'] = self._shift_entropy(self.signatures['epsilon'][-1], external_input)
-        new_state['eta']     = self._birth_eta(self.signatures['eta'][-1], external_input)
+        new_state['tau']     = self._speak(self.signatures['tau'], external_input)
+        new_state['omega']   = self._fracture(self.signatures['omega'], external_input)
+        new_state['delta']   = self._fold_delta(self.signatures['delta'], external_input)
+        new_state['epsilon'] = self._shift_entropy(self.signatures['epsilon'], external_input)
+        new_state['eta']     = self._birth_eta(self.signatures['eta'], external_input)
         
         # 2) δ -> κ, η -> ζ
         new_state['kappa'] = self._child_of_delta(new_state['delta'])
@@ -65,21 +91,24 @@ class SymphonicPhiSystem:
         # 3) Measure curvature
         curvature = self._measure_curvature(new_state)
         
-        # 4) Check if new_state is identical to any prior fold => break symmetry
-        if any(self._compare_state(new_state, old) for old in self.history):
-            # Append "_S" to τ
-            new_state['tau'] = new_state['tau'] + "_S"
-        
-        # 5) Finalize: store new_state in signature lists
-        for k in self.signatures.keys():
-            val = new_state.get(k, "")
-            self.signatures[k].append(val)
+        # 4) No repeat check is needed: _speak returns
+        #    len(old_tau) + len(external_input) + 1 characters, so τ is
+        #    longer than on every earlier fold and new_state can never
+        #    equal a prior one (the "_S" symmetry break could not fire).
+        #    Remembering past states to check anyway kept every fold's
+        #    strings alive.
         
-        # Store in history
-        self.history.append(dict(new_state))
+        # 5) Finalize: new_state becomes the current signatures. Each
+        #    signature's wave sum is taken in the same pass, so every
+        #    string is walked for it exactly once per fold.
+        waves = {}
+        for k in self._NODE_KEYS:
+            val = new_state[k]
+            self.signatures[k] = val
+            waves[k] = self._symbolic_sin_permute_to_int(val)
         
-        # 6) Compute final node from new_state, curvature, and fold_count
-        node_id_str, debug_info = self._compute_node_id(new_state, curvature, self.fold_count)
+        # 6) Compute final node from new_state, waves, curvature, and fold_count
+        node_id_str, debug_info = self._compute_node_id(new_state, waves, curvature, self.fold_count)
         node_str = f"n{node_id_str}@alpay.md"
         
         result = {
@@ -97,47 +126,45 @@ class SymphonicPhiSystem:
     # Refined Collision-Resistant Node Compression
     # ------------------------------------------------------------------
     
-    def _compute_node_id(self, new_state, curvature, fold_count):
+    def _compute_node_id(self, new_state, waves, curvature, fold_count):
         """
-        Build a large integer from purely symbolic transformations, 
-        then do minimal leading-zero trimming, with a softer digit expansion:
+        Build an integer from purely symbolic transformations (kept
+        modulo 10^digit_count throughout), then do minimal leading-zero
+        trimming, with a softer digit expansion:
           digit_count = min(5 + expansions//2, 16)
+        'waves' holds the wave sum of every signature in new_state.
+
+        Called exactly once per fold, in order: the δ half-character
+        tracking depends on it. Results are deliberately not memoized,
+        since fold_count never repeats within one system; the reusable
+        part (the wave sums) is already cached.
 
         Return (node_str, debug_info).
         """
-        # 1) Summation of wave-based permutations
-        product_val = 1
-        for key in ['tau','omega','delta','epsilon','eta','kappa','zeta']:
-            s = new_state.get(key, "")
-            wave_val = self._symbolic_sin_permute_to_int(s)
-            product_val = product_val * (1 + wave_val)
-        
-        # 2) Add in curvature sum
-        total_curv = 0
-        for v in curvature.values():
-            if v.startswith("diff:"):
-                try:
-                    diff_int = int(v.replace("diff:", ""))
-                except:
-                    diff_int = 0
-                total_curv += diff_int
-        
-        # Combine
-        big_val = product_val + total_curv + fold_count
+        # 1) Curvature sum
+        total_curv = sum(curvature.values())
         
-        # 3) Determine expansions (softer)
+        # 2) Determine expansions (softer)
         # We'll define 'pressure' as in the previous approach
         eta_len = len(new_state['eta'])
-        fold_str_len = len(str(fold_count))  # minimal numeric usage, purely derived from internal count
-        wave_omega = self._symbolic_sin_permute_to_int(new_state['omega'])
+        # minimal numeric usage, purely derived from internal count:
+        # its decimal length, read off the powers-of-ten table
+        if 0 < fold_count < self._MOD_BASES[-1]:
+            fold_str_len = bisect_right(self._MOD_BASES, fold_count)
+        else:
+            fold_str_len = len(str(fold_count))
+        wave_omega = waves['omega']
         wave_omega_len = len(str(wave_omega))
         
         pressure = total_curv + eta_len + fold_str_len + wave_omega_len
         
-        # Symbolic divisor
-        half_delta = new_state['delta'][: len(new_state['delta'])//2]
-        unique_chars = set(half_delta)
-        symbolic_divisor = 1 + len(unique_chars)
+        # Symbolic divisor: unique characters in δ's left half. _fold_delta
+        # keeps old_delta[:mid] as the new prefix, and mid is exactly the
+        # previous half, so only the characters past it need adding.
+        half = len(new_state['delta']) // 2
+        self._delta_half_chars.update(new_state['delta'][self._delta_half_len:half])
+        self._delta_half_len = half
+        symbolic_divisor = 1 + len(self._delta_half_chars)
         
         expansions = pressure // symbolic_divisor
         
@@ -146,18 +173,23 @@ class SymphonicPhiSystem:
         if digit_count > 16:
             digit_count = 16
         
-        # 4) We'll mod big_val by 10^digit_count to get a numeric range
-        mod_base = 1
-        for _ in range(digit_count):
-            mod_base *= 10
+        # 3) We'll mod by 10^digit_count to get a numeric range
+        mod_base = self._MOD_BASES[digit_count]
         
+        # 4) Product of wave-based permutations, reduced as we go so it
+        #    never grows into a big integer (same residue as reducing at the end)
+        product_val = 1
+        for key in self._NODE_KEYS:
+            product_val = (product_val * (1 + waves[key])) % mod_base
+        
+        # Combine
+        big_val = product_val + total_curv + fold_count
         final_num = big_val % mod_base
         
-        # 5) Convert to string, strip leading zeros
-        raw_str = str(final_num)
-        stripped = raw_str.lstrip('0')
-        if stripped == '':
-            stripped = '0'  # ensure at least one digit
+        # 5) Convert to string: a positive int never renders with leading
+        #    zeros, so only zero needs its single digit spelled out
+        stripped = str(final_num) if final_num else '0'
+        raw_str = stripped
         
         # Compile debug info if in verbose mode
         debug_info = {
@@ -174,35 +206,35 @@ class SymphonicPhiSystem:
         
         return (stripped, debug_info)
     
-    def _symbolic_sin_permute_to_int(self, s):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _symbolic_sin_permute_to_int(s):
         """
         Fake "trigonometric" permutation:
           - Zigzag index pattern
           - Weighted ASCII sum
+        Pure in `s`, so results are memoized: every signature is hashed
+        once per fold, but ζ settles into a fixed string after the first
+        fold and is then a cache hit every time.
         """
         if not s:
             return 0
         
-        indices = []
-        i = 0
-        step = 1
-        visited = set()
-        while i >= 0 and i < len(s):
-            if i in visited:
-                break
-            visited.add(i)
-            indices.append(i)
-            i += step
-            step = -step
-        
-        remaining = [x for x in range(len(s)) if x not in visited]
-        indices.extend(remaining)
-        
-        total = 0
-        for pos, idx in enumerate(indices):
-            ch = s[idx]
-            total += ord(ch) * (pos + 1)
-        return total
+        # The zigzag walk (+1, -1, +1, ...) visits index 0, then 1, then
+        # bounces back onto 0 and stops; the remaining indices follow in
+        # order. The permutation is therefore the identity, and the sum
+        # reduces to ord(s[i]) * (i + 1) evaluated in C-level iterators.
+        # Codepoints are read straight off an encoded buffer (one encode at
+        # the boundary) instead of one ord() call per character. ASCII
+        # strings iterate as plain bytes; anything else goes via UTF-32.
+        if s.isascii():
+            codepoints = s.encode('ascii')
+        else:
+            codepoints = memoryview(s.encode(_UTF32, 'surrogatepass')).cast('I')
+        # No weight vector is needed: with prefix sums P_k of the n
+        # codepoints, sum((i + 1) * c_i) == (n + 1) * P_n - sum(P_k).
+        total = sum(codepoints)
+        return (len(codepoints) + 1) * total - sum(accumulate(codepoints))
     
     # ------------------------------------------------------------------
     # The original methods for evolving τ, ω, δ, ε, η, κ, ζ
@@ -210,43 +242,27 @@ class SymphonicPhiSystem:
     
     def _speak(self, old_tau, external_input):
         """τ 'speaks' by weaving old_tau + external_input."""
-        combined = []
-        a = list(old_tau)
-        b = list(external_input)
-        while a or b:
-            if a:
-                combined.append(a.pop(0))
-            if b:
-                combined.append(b.pop(0))
-        return "T" + "".join(combined)
+        # Interleave only the overlap with the input (map stops at the
+        # shorter side); the rest of the longer one is a plain slice.
+        n = min(len(old_tau), len(external_input))
+        woven = "".join(map(operator.add, old_tau, external_input))
+        return "T" + woven + old_tau[n:] + external_input[n:]
     
     def _fracture(self, old_omega, external_input):
         """ω 'fractures' by slicing + weaving shards of external_input."""
         half = len(old_omega) // 2
-        part1 = old_omega[:half]
-        part2 = old_omega[half:]
+        cracked = f"{old_omega[:half]}|{old_omega[half:]}"
         
-        cracked = part1 + "|" + part2
-        
-        shards = []
-        c = list(external_input)
-        d = list(cracked)
-        while c or d:
-            if d:
-                shards.append(d.pop(0))
-            if c:
-                shards.append('-'+c.pop(0)+'-')
-        
-        return "".join(shards)
+        # Same shape as _speak: each input char becomes a "-c-" shard after
+        # its ω char; leftover input shards or ω chars follow the overlap.
+        n = min(len(cracked), len(external_input))
+        woven = "".join(map("{}-{}-".format, cracked, external_input))
+        return woven + cracked[n:] + "".join(map("-{}-".format, external_input[n:]))
     
     def _fold_delta(self, old_delta, external_input):
         """δ folds: we fold in half & reverse the right side, inserting external_input."""
         mid = len(old_delta) // 2
-        left = old_delta[:mid]
-        right = old_delta[mid:]
-        right_reversed = right[::-1]
-        
-        return left + "(" + external_input + ")" + right_reversed
+        return f"{old_delta[:mid]}({external_input}){old_delta[mid:][::-1]}"
     
     def _shift_entropy(self, old_epsilon, external_input):
         """ε shifts or rotates the combined string by 1 char."""
@@ -258,13 +274,13 @@ class SymphonicPhiSystem:
     
     def _birth_eta(self, old_eta, external_input):
         """η births: fuse old_eta & input, add a '→' sign."""
-        fused = old_eta + external_input
-        return fused + "→"
+        return f"{old_eta}{external_input}→"
     
     def _child_of_delta(self, new_delta):
         """κ from δ: partial reflection."""
-        alt = new_delta[::2]
-        return "K" + alt[::-1]
+        # δ's even indices, last one first, taken in a single stride
+        start = -1 if len(new_delta) % 2 else -2
+        return "K" + new_delta[start::-2]
     
     def _child_of_eta(self, new_eta):
         """ζ from η: gather substring before '→' reversed, plus 'Z' prefix."""
@@ -281,35 +297,18 @@ class SymphonicPhiSystem:
     def _measure_curvature(self, new_state):
         """Count character differences from the previous fold for τ, ω, δ, ε, η."""
         curvature = {}
-        for key in ['tau','omega','delta','epsilon','eta']:
-            old_str = self.signatures[key][-1] if self.signatures[key] else ""
+        for key in self._CURV_KEYS:
+            old_str = self.signatures[key]
             new_str = new_state[key]
             diff_count = self._compare_chars(old_str, new_str)
-            curvature[key] = f"diff:{diff_count}"
+            curvature[key] = diff_count
         return curvature
     
     def _compare_chars(self, s1, s2):
         """Count differing positions between s1 and s2."""
-        length = max(len(s1), len(s2))
-        diff = 0
-        for i in range(length):
-            c1 = s1[i] if i < len(s1) else ''
-            c2 = s2[i] if i < len(s2) else ''
-            if c1 != c2:
-                diff += 1
-        return diff
-    
-    def _compare_state(self, s1, s2):
-        """
-        Returns True if s1 and s2 match in τ, ω, δ, ε, η, κ, ζ exactly.
-        """
-        main_keys = ['tau','omega','delta','epsilon','eta','kappa','zeta']
-        for k in main_keys:
-            if k not in s1 or k not in s2:
-                return False
-            if s1[k] != s2[k]:
-                return False
-        return True
+        # Positions past the shorter string always differ; the overlap is
+        # compared pairwise in C via map(ne, ...).
+        return sum(map(operator.ne, s1, s2)) + abs(len(s1) - len(s2))
 
 
 # ----------------------------------------------------------------------
@@ -323,11 +322,11 @@ def run_generate(verbose=False):
     print("\n=== Single Fold Generation ===")
     print(f"Fold Count: {result['fold_count']}")
     print("Signatures:")
-    for k in ['tau','omega','delta','epsilon','eta','kappa','zeta']:
+    for k in SymphonicPhiSystem._NODE_KEYS:
         print(f"  {k}: {result['fold_signatures'][k]}")
     print("\nCurvature:")
     for k, v in result['curvature'].items():
-        print(f"  {k}: {v}")
+        print(f"  {k}: diff:{v}")
     
     print(f"\nFinal Node => {result['node']}")
     
@@ -377,7 +376,7 @@ def run_test(iterations=10, verbose=False):
         if verbose and 'debug_info' in res:
             dbg = res['debug_info']
             # Show curvature "fingerprint" plus digit_count, expansions, etc.
-            curv_str = ",".join(f"{k}:{v}" for k,v in res['curvature'].items())
+            curv_str = ",".join(f"{k}:diff:{v}" for k,v in res['curvature'].items())
             print(f"{i:<6} {node:<20} {curv_str:<15} {dbg['digit_count']:<6} "
                   f"press={dbg['pressure']} exp={dbg['expansions']}")
         else:
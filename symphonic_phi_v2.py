@@ -22,6 +22,106 @@ Contact: alpay@lightcap.ai
 
 import sys
 import argparse
+import operator
+import re
+from functools import lru_cache
+from itertools import accumulate
+
+
+# UTF-32 in native byte order, so cast('I') reads codepoints on any host;
+# surrogatepass keeps lone surrogates (valid str, e.g. from surrogateescape)
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+# nXXXX[|W-<omega>C-<curv>K-<kappa>F-<fold>][@alpay.md], matched in one pass
+_NODE_RE = re.compile(
+    r'n(?P<id>[^|@]*)'
+    r'(?:\|W-(?P<omega>\d+)C-(?P<curv>\d+)K-(?P<kappa>\d+)F-(?P<fold>\d+))?'
+    r'(?:@alpay\.md)?'
+)
+
+
+def _parse_node(node_str):
+    """
+    Split a node string into (numeric_id, wave_omega, curv_sum, kappa_sum,
+    fold_count). Well-formed nodes take one _NODE_RE match; anything else
+    is scanned field by field, so a truncated wave part or a foreign
+    domain keeps whatever fields it has. Missing or malformed fields are 0
+    (the ID is kept as a string, "" when absent).
+    """
+    m = _NODE_RE.fullmatch(node_str)
+    if m:
+        if m.group('fold') is None:
+            return m.group('id'), 0, 0, 0, 0
+        # _int_or_zero, not int(): a field past the int-from-string digit
+        # limit reads as 0 instead of raising
+        return (m.group('id'), _int_or_zero(m.group('omega')),
+                _int_or_zero(m.group('curv')), _int_or_zero(m.group('kappa')),
+                _int_or_zero(m.group('fold')))
+    
+    head, pipe, wave_part = node_str.partition('|')
+    if not pipe:
+        # nXXXX@domain: strip whatever domain follows
+        head = node_str.split('@', 1)[0]
+    numeric_id = head[1:] if head.startswith('n') else ""
+    
+    # W-<omega>C-<curv>K-<kappa>F-<fold>: each marker closes the field
+    # before it, F- also opens the fold count
+    fields = [0, 0, 0, 0]
+    wave_part = wave_part.replace('@alpay.md', '')
+    if wave_part.startswith('W-'):
+        wave_part = wave_part[2:]
+    for i, marker in enumerate(('C-', 'K-', 'F-')):
+        idx = wave_part.find(marker)
+        if idx == -1:
+            continue
+        fields[i] = _int_or_zero(wave_part[:idx])
+        wave_part = wave_part[idx+2:]
+        if marker == 'F-':
+            fields[3] = _int_or_zero(wave_part)
+    return (numeric_id, *fields)
+
+
+def _int_or_zero(text):
+    try:
+        return int(text)
+    except ValueError:
+        return 0
+
+
+# Signature order used everywhere, and the evolved ones curvature tracks
+_KEYS = ('tau', 'omega', 'delta', 'epsilon', 'eta', 'kappa', 'zeta')
+_CURV_KEYS = _KEYS[:5]
+
+# 10^digit_count for every digit_count a node ID can have (5..16)
+_POW10 = tuple(10**i for i in range(17))
+
+
+@lru_cache(maxsize=64)
+def _wave_sum(s):
+    """
+    Wave-based permutation sum of s, memoized: it is pure in s, and
+    while each signature is hashed once per fold, ζ settles into a
+    fixed string and hits the cache on every fold after the first.
+    Bounded because the signatures grow every fold.
+    """
+    if not s:
+        return 0
+    
+    # The zigzag walk (+1, -1, +1, ...) visits index 0, then 1, then
+    # bounces back onto 0 and stops; the remaining indices follow in
+    # order. So the permutation is the identity for every length and
+    # the sum is ord(s[i]) * (i + 1).
+    #
+    # Codepoints come straight off an encoded buffer (plain bytes for
+    # ASCII, 32-bit units otherwise) rather than one ord() per char, and
+    # with prefix sums P_k: sum((i + 1) * c_i) == (n + 1) * P_n - sum(P_k),
+    # so the whole kernel is three C-level reductions.
+    if s.isascii():
+        codepoints = s.encode('ascii')
+    else:
+        codepoints = memoryview(s.encode(_UTF32, 'surrogatepass')).cast('I')
+    return (len(codepoints) + 1) * sum(codepoints) - sum(accumulate(codepoints))
 
 
 class SymphonicPhiSystem:
@@ -32,21 +132,24 @@ class SymphonicPhiSystem:
         Initialize the φ system with minimal seeds, 
         OR parse 'resume_node' to re-initialize fold_count + wave frequencies.
         """
+        # Latest value of each signature (earlier folds are never read back)
         self.signatures = {
-            'tau': ['τ'],      # Let τ "speak"
-            'omega': ['ω'],    # Let ω "fracture"
-            'delta': ['δ'],    # Let δ fold into κ
-            'epsilon': ['ε'],  # Track "entropy"
-            'eta': ['η'],      # Let η birth ζ
-            'kappa': [],
-            'zeta': []
+            'tau': 'τ',      # Let τ "speak"
+            'omega': 'ω',    # Let ω "fracture"
+            'delta': 'δ',    # Let δ fold into κ
+            'epsilon': 'ε',  # Track "entropy"
+            'eta': 'η',      # Let η birth ζ
+            'kappa': '',
+            'zeta': ''
         }
-        self.history = []
-        
         # We'll have an internal fold_count that we *may* set from the resume node
         self.fold_count = 0
         self.verbose = verbose
         
+        # Unique characters of δ's left half, and how much of δ they cover
+        self._delta_half_chars = set()
+        self._delta_half_len = 0
+        
         if resume_node:
             # Attempt to parse node to restore system
             self._resume_from_node(resume_node)
@@ -64,11 +167,12 @@ class SymphonicPhiSystem:
         
         new_state = {}
         # 1) Evolve each main signature
-        new_state['tau']     = self._speak(self.signatures['tau'][-1], external_input)
-        new_state['omega']   = self._fracture(self.signatures['omega'][-1], external_input)
-        new_state['delta']   = self._fold_delta(self.signatures['delta'][-1], external_input)
-        new_state['epsilon'] = self._shift_entropy(self.signatures['epsilon'][-1], external_input)
-        new_state['eta']     = self._birth_eta(self.signatures['eta'][-1], external_input)
+        sigs = self.signatures
+        new_state['tau']     = self._speak(sigs['tau'], external_input)
+        new_state['omega']   = self._fracture(sigs['omega'], external_input)
+        new_state['delta']   = self._fold_delta(sigs['delta'], external_input)
+        new_state['epsilon'] = self._shift_entropy(sigs['epsilon'], external_input)
+        new_state['eta']     = self._birth_eta(sigs['eta'], external_input)
         
         # 2) δ -> κ, η -> ζ
         new_state['kappa'] = self._child_of_delta(new_state['delta'])
@@ -77,31 +181,24 @@ class SymphonicPhiSystem:
         # 3) Measure curvature
         curvature = self._measure_curvature(new_state)
         
-        # 4) Check if new_state is identical to any prior fold => break symmetry
-        if any(self._compare_state(new_state, old) for old in self.history):
-            new_state['tau'] = new_state['tau'] + "_S"
+        # 4) No repeat check is needed: _speak returns
+        #    len(old_tau) + len(external_input) + 1 characters, so τ is
+        #    longer than on every earlier fold and new_state can never
+        #    equal a prior one (the "_S" symmetry break could not fire).
+        #    Remembering past states to check anyway kept every fold's
+        #    strings alive.
         
         # 5) Store new_state
-        for k in self.signatures.keys():
-            val = new_state.get(k, "")
-            self.signatures[k].append(val)
-        
-        self.history.append(dict(new_state))
+        for k in _KEYS:
+            sigs[k] = new_state[k]
         
         # 6) Compute final node
-        node_id_str, debug_info = self._compute_node_id(new_state, curvature, self.fold_count)
+        node_id_str, wave_sums, debug_info = self._compute_node_id(new_state, curvature, self.fold_count)
         
         # 7) Build a "waveform fingerprint" appended after a pipe
-        wave_omega = self._symbolic_sin_permute_to_int(new_state['omega'])
-        wave_kappa = self._symbolic_sin_permute_to_int(new_state['kappa'])
-        total_curv = 0
-        for v in curvature.values():
-            if v.startswith("diff:"):
-                try:
-                    diff_int = int(v.replace("diff:", ""))
-                except:
-                    diff_int = 0
-                total_curv += diff_int
+        wave_omega = wave_sums['omega']
+        wave_kappa = wave_sums['kappa']
+        total_curv = sum(curvature.values())
         
         wave_fingerprint = f"W-{wave_omega}C-{total_curv}K-{wave_kappa}F-{self.fold_count}"
         
@@ -109,7 +206,7 @@ class SymphonicPhiSystem:
         
         result = {
             'fold_signatures': new_state,
-            'curvature': curvature,
+            'curvature': self._format_curvature(curvature),
             'node': final_node_str,
             'fold_count': self.fold_count
         }
@@ -128,27 +225,12 @@ class SymphonicPhiSystem:
         and optionally re-init wave states.
         Format: nXXXXXXXX|W-<omega>C-<curv>K-<kappa>F-<foldCount>@alpay.md
         """
-        if '|' not in node_str:
-            return
-        
-        before_pipe, after_pipe = node_str.split('|', 1)
-        if '@alpay.md' in after_pipe:
-            after_pipe = after_pipe.replace('@alpay.md', '')
+        restored_fold = _parse_node(node_str)[4]
+        if restored_fold > 0:
+            self.fold_count = restored_fold
         
-        # Now after_pipe might be W-999C-10K-50F-123
-        # We'll parse out F- foldCount
-        pieces = after_pipe.split('F-')
-        if len(pieces) == 2:
-            freq_part, fold_str = pieces
-            try:
-                restored_fold = int(fold_str)
-                if restored_fold > 0:
-                    self.fold_count = restored_fold
-            except:
-                pass
-            
-            # freq_part might be 'W-999C-10K-50'
-            # We could parse wave sums to reinit states, if desired.
+        # The W-/C-/K- groups hold the wave sums, should we ever want
+        # to re-init states from them.
     
     # ------------------------------------------------------------------
     # Node ID logic
@@ -158,47 +240,45 @@ class SymphonicPhiSystem:
         """
         Build an integer from wave-based permutations, curvature, fold_count,
         do softer digit expansions, remove leading zeros.
+        Returns (node_digits, wave_sums, debug_info); wave_sums maps each
+        signature key to its wave sum so callers need not recompute them.
         """
-        # 1) Summation of wave permutations
-        product_val = 1
-        for key in ['tau','omega','delta','epsilon','eta','kappa','zeta']:
-            s = new_state.get(key, "")
-            wave_val = self._symbolic_sin_permute_to_int(s)
-            product_val = product_val * (1 + wave_val)
-        
-        # 2) curvature sum
-        total_curv = 0
-        for v in curvature.values():
-            if v.startswith("diff:"):
-                try:
-                    diff_int = int(v.replace("diff:", ""))
-                except:
-                    diff_int = 0
-                total_curv += diff_int
-        
-        big_val = product_val + total_curv + fold_count
+        # 1) wave sums and curvature sum
+        wave_sums = {}
+        for key in _KEYS:
+            wave_sums[key] = self._symbolic_sin_permute_to_int(new_state.get(key, ""))
+        total_curv = sum(curvature.values())
         
-        # 3) expansions
+        # 2) expansions
         eta_len = len(new_state['eta'])
-        wave_omega = self._symbolic_sin_permute_to_int(new_state['omega'])
+        wave_omega = wave_sums['omega']
         wave_omega_len = len(str(wave_omega))
         fold_str_len = len(str(fold_count))
         
         pressure = total_curv + eta_len + wave_omega_len + fold_str_len
         
-        half_delta = new_state['delta'][: len(new_state['delta'])//2]
-        unique_chars = set(half_delta)
-        symbolic_divisor = 1 + len(unique_chars)
+        # Unique characters in δ's left half. _fold_delta keeps
+        # old_delta[:mid] as the new prefix and mid is the previous half,
+        # so only the characters past it are new.
+        half = len(new_state['delta']) // 2
+        self._delta_half_chars.update(new_state['delta'][self._delta_half_len:half])
+        self._delta_half_len = half
+        symbolic_divisor = 1 + len(self._delta_half_chars)
         
         expansions = pressure // symbolic_divisor
         digit_count = 5 + (expansions // 2)
         if digit_count > 16:
             digit_count = 16
         
-        mod_base = 1
-        for _ in range(digit_count):
-            mod_base *= 10
+        mod_base = _POW10[digit_count]
+        
+        # 3) product of (1 + wave) reduced modulo mod_base at every step;
+        # only the residue is used, so it never grows past mod_base**2.
+        product_val = 1
+        for key in _KEYS:
+            product_val = product_val * (1 + wave_sums[key]) % mod_base
         
+        big_val = product_val + total_curv + fold_count
         final_num = big_val % mod_base
         
         # remove leading zeros
@@ -219,50 +299,25 @@ class SymphonicPhiSystem:
             'final_node_digits': stripped
         }
         
-        return stripped, debug_info
+        return stripped, wave_sums, debug_info
     
     def _symbolic_sin_permute_to_int(self, s):
         """
         The fake "wave-based" permutation sum approach.
         """
-        if not s:
-            return 0
-        
-        indices = []
-        i = 0
-        step = 1
-        visited = set()
-        while i >= 0 and i < len(s):
-            if i in visited:
-                break
-            visited.add(i)
-            indices.append(i)
-            i += step
-            step = -step
-        
-        remaining = [x for x in range(len(s)) if x not in visited]
-        indices.extend(remaining)
-        
-        total = 0
-        for pos, idx in enumerate(indices):
-            ch = s[idx]
-            total += ord(ch) * (pos + 1)
-        return total
+        return _wave_sum(s)
     
     # ------------------------------------------------------------------
     # Evolving τ, ω, δ, ε, η, κ, ζ
     # ------------------------------------------------------------------
     
     def _speak(self, old_tau, external_input):
-        combined = []
-        a = list(old_tau)
-        b = list(external_input)
-        while a or b:
-            if a:
-                combined.append(a.pop(0))
-            if b:
-                combined.append(b.pop(0))
-        return "T" + "".join(combined)
+        # Only the overlap with the input is interleaved per character
+        # (map stops at the shorter side); the longer side's remainder
+        # is a plain slice.
+        n = min(len(old_tau), len(external_input))
+        woven = "".join(map(operator.add, old_tau, external_input))
+        return "T" + woven + old_tau[n:] + external_input[n:]
     
     def _fracture(self, old_omega, external_input):
         half = len(old_omega) // 2
@@ -270,43 +325,36 @@ class SymphonicPhiSystem:
         part2 = old_omega[half:]
         cracked = part1 + "|" + part2
         
-        shards = []
-        c = list(external_input)
-        d = list(cracked)
-        while c or d:
-            if d:
-                shards.append(d.pop(0))
-            if c:
-                shards.append('-'+c.pop(0)+'-')
-        return "".join(shards)
+        # Same shape as _speak: shards are woven only where both sides
+        # have characters, then the remainder of either side is appended.
+        n = min(len(cracked), len(external_input))
+        woven = "".join(map("{}-{}-".format, cracked, external_input))
+        return woven + cracked[n:] + "".join(map("-{}-".format, external_input[n:]))
     
     def _fold_delta(self, old_delta, external_input):
         mid = len(old_delta) // 2
-        left = old_delta[:mid]
-        right = old_delta[mid:]
-        right_reversed = right[::-1]
-        return left + "(" + external_input + ")" + right_reversed
+        # old_delta[:mid-1:-1] is old_delta[mid:] reversed, in one slice;
+        # mid == 0 (at most one char) would read as [:-1:-1], so reverse whole
+        right_reversed = old_delta[:mid-1:-1] if mid else old_delta[::-1]
+        return f"{old_delta[:mid]}({external_input}){right_reversed}"
     
     def _shift_entropy(self, old_epsilon, external_input):
         mix = old_epsilon + external_input
-        if len(mix) <= 1:
-            return "E" + mix
-        else:
-            return mix[1:] + mix[0]
+        # Rotate by one; only a bare seed (no input yet) gets the 'E' mark
+        return mix[1:] + mix[:1] if len(mix) > 1 else "E" + mix
     
     def _birth_eta(self, old_eta, external_input):
         fused = old_eta + external_input
         return fused + "→"
     
     def _child_of_delta(self, new_delta):
-        alt = new_delta[::2]
-        return "K" + alt[::-1]
+        # Even indices of δ, last one first, in a single stride
+        start = -1 if len(new_delta) % 2 else -2
+        return "K" + new_delta[start::-2]
     
     def _child_of_eta(self, new_eta):
-        if '→' in new_eta:
-            core = new_eta.split('→')[0]
-        else:
-            core = new_eta
+        # partition() yields the whole string as the head when '→' is absent
+        core = new_eta.partition('→')[0]
         return "Z" + core[::-1]
     
     # ------------------------------------------------------------------
@@ -315,31 +363,21 @@ class SymphonicPhiSystem:
     
     def _measure_curvature(self, new_state):
         curvature = {}
-        for key in ['tau','omega','delta','epsilon','eta']:
-            old_str = self.signatures[key][-1] if self.signatures[key] else ""
+        for key in _CURV_KEYS:
+            old_str = self.signatures.get(key, "")
             new_str = new_state[key]
             diff_count = self._compare_chars(old_str, new_str)
-            curvature[key] = f"diff:{diff_count}"
+            curvature[key] = diff_count
         return curvature
     
+    def _format_curvature(self, curvature):
+        """Render integer diff counts in the 'diff:N' form shown to callers."""
+        return {key: f"diff:{n}" for key, n in curvature.items()}
+    
     def _compare_chars(self, s1, s2):
-        length = max(len(s1), len(s2))
-        diff = 0
-        for i in range(length):
-            c1 = s1[i] if i < len(s1) else ''
-            c2 = s2[i] if i < len(s2) else ''
-            if c1 != c2:
-                diff += 1
-        return diff
-    
-    def _compare_state(self, s1, s2):
-        main_keys = ['tau','omega','delta','epsilon','eta','kappa','zeta']
-        for k in main_keys:
-            if k not in s1 or k not in s2:
-                return False
-            if s1[k] != s2[k]:
-                return False
-        return True
+        # Every position past the shorter string differs; the overlap is
+        # compared pairwise in C.
+        return sum(map(operator.ne, s1, s2)) + abs(len(s1) - len(s2))
 
 
 # ----------------------------------------------------------------------
@@ -353,7 +391,7 @@ def run_generate(verbose=False, resume=None):
     print("\n=== Single Fold Generation ===")
     print(f"Fold Count: {result['fold_count']}")
     print("Signatures:")
-    for k in ['tau','omega','delta','epsilon','eta','kappa','zeta']:
+    for k in _KEYS:
         print(f"  {k}: {result['fold_signatures'][k]}")
     print("\nCurvature:")
     for k, v in result['curvature'].items():
@@ -370,11 +408,20 @@ def run_generate(verbose=False, resume=None):
     print("=== End ===")
 
 
+# Fold rows buffered per write in run_test
+_TEST_OUTPUT_BATCH = 1000
+
+
 def run_test(iterations=10, verbose=False, resume=None):
     """
     Run multiple folds with identical input,
     checking for collisions. 
     If 'resume' is provided, we parse that node first.
+
+    Folds run serially on purpose: each fold evolves the previous fold's
+    signatures, so the chain cannot be split across workers. Resuming
+    shards from synthetic nodes only restores fold_count, not the
+    signatures, so they would test a different set of nodes.
     """
     phi = SymphonicPhiSystem(verbose=verbose, resume_node=resume)
     
@@ -391,11 +438,16 @@ def run_test(iterations=10, verbose=False, resume=None):
     generated_nodes = set()
     static_input = "TEST"
     
+    # Rows are written in batches rather than one print() per fold
+    lines = []
+    
     for i in range(1, iterations+1):
         res = phi.fold(static_input)
         node = res['node']
         
         if node in generated_nodes:
+            if lines:
+                print("\n".join(lines))
             print(f"\nCOLLISION at fold {i}: {node}")
             raise AssertionError("Collision detected — φ has failed!")
         generated_nodes.add(node)
@@ -403,10 +455,16 @@ def run_test(iterations=10, verbose=False, resume=None):
         if verbose and 'debug_info' in res:
             dbg = res['debug_info']
             curv_str = ",".join(f"{k}:{v}" for k,v in res['curvature'].items())
-            print(f"{i:<6} {node:<28} {curv_str:<15} {dbg['digit_count']}")
+            lines.append(f"{i:<6} {node:<28} {curv_str:<15} {dbg['digit_count']}")
         else:
-            print(f"{i:<6} {node:<60}")
+            lines.append(f"{i:<6} {node:<60}")
+        
+        if len(lines) >= _TEST_OUTPUT_BATCH:
+            print("\n".join(lines))
+            lines.clear()
     
+    if lines:
+        print("\n".join(lines))
     print("-"*70)
     print(f"SUCCESS! {iterations} unique nodes generated from identical input.")
 
@@ -430,83 +488,9 @@ def run_resolve(node_string):
     print("\n=== φ Identity Resolution ===")
     print(f"Node: {node_string}")
     
-    # 1) Extract numeric ID => 'nXXXX'
-    #    We'll split on '|'
-    numeric_id = ""
-    wave_part = ""
-    if '|' in node_string:
-        left, right = node_string.split('|', 1)
-        # left might be nXXXX
-        if left.startswith('n'):
-            numeric_id = left[1:]  # skip 'n'
-        # right might be W-1820C-10K-888F-123@alpay.md
-        if '@alpay.md' in right:
-            right = right.replace('@alpay.md', '')
-        wave_part = right
-    else:
-        # fallback: if we have no '|', it might just be nXXXX@alpay.md
-        # minimal parse
-        if node_string.startswith('n'):
-            # strip possible domain part
-            parts = node_string.split('@',1)
-            numeric_id = parts[0][1:] if len(parts)>0 else ""
-    
-    # parse wave_part => W-<omega>C-<curv>K-<kappa>F-<fold>
-    # We'll attempt to parse with a simple approach
-    # default: wave_omega=0, curv=0, kappa=0, folds=0
-    wave_omega = 0
-    curv_sum = 0
-    kappa_sum = 0
-    fold_count = 0
-    
-    # Example wave_part: "W-1820C-10K-888F-123"
-    # We'll do stepwise:
-    #  1) split by 'W-', 'C-', 'K-', 'F-'
-    # or we can do a simpler approach by scanning.
-    # Let's just do naive scanning with .split('W-') etc.
-    
-    # If wave_part is empty, we'll skip
-    if wave_part:
-        # remove leading 'W-'
-        if wave_part.startswith('W-'):
-            wave_part = wave_part[2:]  # remove 'W-'
-        
-        # Now wave_part might start with e.g. "1820C-10K-888F-123"
-        # We'll find 'C-'
-        c_idx = wave_part.find('C-')
-        if c_idx != -1:
-            w_str = wave_part[:c_idx]
-            wave_part = wave_part[c_idx+2:]
-            try:
-                wave_omega = int(w_str)
-            except:
-                wave_omega = 0
-        
-        # wave_part might now be "10K-888F-123"
-        k_idx = wave_part.find('K-')
-        if k_idx != -1:
-            c_str = wave_part[:k_idx]
-            wave_part = wave_part[k_idx+2:]
-            try:
-                curv_sum = int(c_str)
-            except:
-                curv_sum = 0
-        
-        # wave_part might now be "888F-123"
-        f_idx = wave_part.find('F-')
-        if f_idx != -1:
-            k_str = wave_part[:f_idx]
-            wave_part = wave_part[f_idx+2:]
-            try:
-                kappa_sum = int(k_str)
-            except:
-                kappa_sum = 0
-            
-            # wave_part might now be '123'
-            try:
-                fold_count = int(wave_part)
-            except:
-                fold_count = 0
+    # 1) Extract numeric ID and W-<omega>C-<curv>K-<kappa>F-<fold>;
+    #    anything missing or malformed reads as 0
+    numeric_id, wave_omega, curv_sum, kappa_sum, fold_count = _parse_node(node_string)
     
     # Now we have numeric_id, wave_omega, curv_sum, kappa_sum, fold_count
     # 2) Symbolic pressure => wave_omega + curv_sum + kappa_sum
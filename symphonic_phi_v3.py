@@ -26,7 +26,26 @@ Contact: alpay@lightcap.ai
 
 import sys
 import argparse
+import operator
 import re
+from itertools import accumulate, combinations
+
+
+# UTF-32 in native byte order, so cast('I') reads codepoints on any host;
+# surrogatepass keeps lone surrogates (valid str, e.g. from surrogateescape)
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+# nXXXX[|W-<omega>C-<curv>K-<kappa>F-<fold>][@alpay.md], matched in one pass
+_NODE_RE = re.compile(
+    r'n(?P<id>\d*)'
+    r'(?:\|W-(?P<omega>\d+)C-(?P<curv>\d+)K-(?P<kappa>\d+)F-(?P<fold>\d+))?'
+    r'(?:@alpay\.md)?'
+)
+
+# 10^digit_count for every digit_count a node ID can have (5..16)
+_POW10 = tuple(10**i for i in range(17))
+
 
 class SymphonicPhiSystem:
     def __init__(self, 
@@ -36,21 +55,24 @@ class SymphonicPhiSystem:
         Initialize the φ system with minimal seeds, 
         OR parse 'resume_node' to re-initialize fold_count + wave frequencies.
         """
+        # Latest value of each signature (earlier folds are never read back)
         self.signatures = {
-            'tau': ['τ'],      # Let τ "speak"
-            'omega': ['ω'],    # Let ω "fracture"
-            'delta': ['δ'],    # Let δ fold into κ
-            'epsilon': ['ε'],  # Track "entropy"
-            'eta': ['η'],      # Let η birth ζ
-            'kappa': [],
-            'zeta': []
+            'tau': 'τ',        # Let τ "speak"
+            'omega': 'ω',      # Let ω "fracture"
+            'delta': 'δ',      # Let δ fold into κ
+            'epsilon': 'ε',    # Track "entropy"
+            'eta': 'η',        # Let η birth ζ
+            'kappa': '',
+            'zeta': ''
         }
-        self.history = []
-        
         # We'll have an internal fold_count that we *may* set from the resume node
         self.fold_count = 0
         self.verbose = verbose
         
+        # Unique characters of δ's left half, and how much of δ they cover
+        self._delta_half_chars = set()
+        self._delta_half_len = 0
+        
         if resume_node:
             self._resume_from_node(resume_node)
     
@@ -59,7 +81,7 @@ class SymphonicPhiSystem:
         Perform one symbolic fold. 
         Returns a dict with:
           - fold_signatures
-          - curvature
+          - curvature (differing characters per key)
           - node (internal)
           - public_node (RFC-compliant email)
           - fold_count
@@ -68,11 +90,11 @@ class SymphonicPhiSystem:
         
         new_state = {}
         # 1) Evolve each main signature
-        new_state['tau']     = self._speak(self.signatures['tau'][-1], external_input)
-        new_state['omega']   = self._fracture(self.signatures['omega'][-1], external_input)
-        new_state['delta']   = self._fold_delta(self.signatures['delta'][-1], external_input)
-        new_state['epsilon'] = self._shift_entropy(self.signatures['epsilon'][-1], external_input)
-        new_state['eta']     = self._birth_eta(self.signatures['eta'][-1], external_input)
+        new_state['tau']     = self._speak(self.signatures['tau'], external_input)
+        new_state['omega']   = self._fracture(self.signatures['omega'], external_input)
+        new_state['delta']   = self._fold_delta(self.signatures['delta'], external_input)
+        new_state['epsilon'] = self._shift_entropy(self.signatures['epsilon'], external_input)
+        new_state['eta']     = self._birth_eta(self.signatures['eta'], external_input)
         
         # 2) δ -> κ, η -> ζ
         new_state['kappa'] = self._child_of_delta(new_state['delta'])
@@ -81,32 +103,29 @@ class SymphonicPhiSystem:
         # 3) Measure curvature
         curvature = self._measure_curvature(new_state)
         
-        # 4) Check if new_state is identical to any prior fold => break symmetry
-        if any(self._compare_state(new_state, old) for old in self.history):
-            new_state['tau'] = new_state['tau'] + "_S"
+        # 4) No repeat check is needed: _speak returns
+        #    len(old_tau) + len(external_input) + 1 characters, so τ is
+        #    longer than on every earlier fold and new_state can never
+        #    equal a prior one (the "_S" symmetry break could not fire).
+        #    Remembering past states to check anyway kept every fold's
+        #    strings alive.
         
         # 5) Store new_state
         for k in self.signatures.keys():
-            val = new_state.get(k, "")
-            self.signatures[k].append(val)
-        
-        self.history.append(dict(new_state))
-        
-        # 6) Compute final node (numeric ID)
-        node_id_str, debug_info = self._compute_node_id(new_state, curvature, self.fold_count)
-        
-        # 7) Build the wave fingerprint for the internal node
-        wave_omega = self._symbolic_sin_permute_to_int(new_state['omega'])
-        wave_kappa = self._symbolic_sin_permute_to_int(new_state['kappa'])
-        total_curv = 0
-        for v in curvature.values():
-            if v.startswith("diff:"):
-                try:
-                    diff_int = int(v.replace("diff:", ""))
-                except:
-                    diff_int = 0
-                total_curv += diff_int
+            self.signatures[k] = new_state[k]
         
+        # 6) Wave sums and curvature total, shared by the node ID and
+        #    the fingerprint
+        wave_vals = {k: self._symbolic_sin_permute_to_int(new_state[k])
+                     for k in ['tau','omega','delta','epsilon','eta','kappa','zeta']}
+        total_curv = sum(curvature.values())
+        
+        # 7) Compute final node (numeric ID)
+        node_id_str, debug_info = self._compute_node_id(new_state, wave_vals, total_curv, self.fold_count)
+        
+        # 8) Build the wave fingerprint for the internal node
+        wave_omega = wave_vals['omega']
+        wave_kappa = wave_vals['kappa']
         wave_fingerprint = f"W-{wave_omega}C-{total_curv}K-{wave_kappa}F-{self.fold_count}"
         
         # Public vs. internal
@@ -134,79 +153,58 @@ class SymphonicPhiSystem:
         Parse node_str to set approximate or exact fold_count 
         Format: nXXXX|W-<omega>C-<curv>K-<kappa>F-<foldCount>@alpay.md
         """
-        if '|' not in node_str:
-            return
-        
-        before_pipe, after_pipe = node_str.split('|', 1)
-        if '@alpay.md' in after_pipe:
-            after_pipe = after_pipe.replace('@alpay.md', '')
-        
-        pieces = after_pipe.split('F-')
-        if len(pieces) == 2:
-            freq_part, fold_str = pieces
-            try:
-                restored_fold = int(fold_str)
-                if restored_fold > 0:
-                    self.fold_count = restored_fold
-            except:
-                pass
+        # Same parser as --graph/--resolve; a node without a wave part
+        # reads as fold_count 0 and leaves the system unchanged
+        restored_fold = parse_node_for_graph(node_str)['fold_count']
+        if restored_fold > 0:
+            self.fold_count = restored_fold
     
     # ------------------------------------------------------------------
     # Node ID logic
     # ------------------------------------------------------------------
     
-    def _compute_node_id(self, new_state, curvature, fold_count):
+    def _compute_node_id(self, new_state, wave_vals, total_curv, fold_count):
         """
         Build an integer from wave-based permutations, curvature, fold_count,
         do softer digit expansions, remove leading zeros.
+        wave_vals maps each signature key to its wave sum and total_curv is
+        the summed curvature; fold() computes both once per fold.
         """
         # 1) Summation of wave permutations
         product_val = 1
         for key in ['tau','omega','delta','epsilon','eta','kappa','zeta']:
-            s = new_state.get(key, "")
-            wave_val = self._symbolic_sin_permute_to_int(s)
-            product_val *= (1 + wave_val)
-        
-        # 2) curvature sum
-        total_curv = 0
-        for v in curvature.values():
-            if v.startswith("diff:"):
-                try:
-                    diff_int = int(v.replace("diff:", ""))
-                except:
-                    diff_int = 0
-                total_curv += diff_int
+            product_val *= (1 + wave_vals[key])
         
         big_val = product_val + total_curv + fold_count
         
-        # 3) expansions
+        # 2) expansions
         eta_len = len(new_state['eta'])
-        wave_omega = self._symbolic_sin_permute_to_int(new_state['omega'])
+        wave_omega = wave_vals['omega']
         wave_omega_len = len(str(wave_omega))
         fold_str_len = len(str(fold_count))
         
         pressure = total_curv + eta_len + wave_omega_len + fold_str_len
         
-        half_delta = new_state['delta'][: len(new_state['delta'])//2]
-        unique_chars = set(half_delta)
-        symbolic_divisor = 1 + len(unique_chars)
+        # Unique characters in δ's left half. _fold_delta keeps
+        # old_delta[:mid] as the new prefix and mid is the previous half,
+        # so only the characters past it are new.
+        half = len(new_state['delta']) // 2
+        self._delta_half_chars.update(new_state['delta'][self._delta_half_len:half])
+        self._delta_half_len = half
+        symbolic_divisor = 1 + len(self._delta_half_chars)
         
         expansions = pressure // symbolic_divisor
         digit_count = 5 + (expansions // 2)
         if digit_count > 16:
             digit_count = 16
         
-        mod_base = 1
-        for _ in range(digit_count):
-            mod_base *= 10
+        mod_base = _POW10[digit_count]
         
         final_num = big_val % mod_base
         
         # remove leading zeros
         raw_str = str(final_num)
-        stripped = raw_str.lstrip('0')
-        if stripped == '':
-            stripped = '0'
+        stripped = raw_str.lstrip('0') or '0'
         
         debug_info = {
             'big_val': str(big_val),
@@ -227,64 +225,48 @@ class SymphonicPhiSystem:
         if not s:
             return 0
         
-        indices = []
-        i = 0
-        step = 1
-        visited = set()
-        while i >= 0 and i < len(s):
-            if i in visited:
-                break
-            visited.add(i)
-            indices.append(i)
-            i += step
-            step = -step
-        
-        remaining = [x for x in range(len(s)) if x not in visited]
-        indices.extend(remaining)
-        
-        total = 0
-        for pos, idx in enumerate(indices):
-            ch = s[idx]
-            total += ord(ch) * (pos + 1)
-        return total
+        # The zigzag walk (+1, -1, +1, ...) visits index 0, then 1, then
+        # bounces back onto 0 and stops; the remaining indices follow in
+        # order. So the permutation is the identity for every length and
+        # the sum is ord(s[i]) * (i + 1).
+        #
+        # Codepoints come straight off an encoded buffer (plain bytes for
+        # ASCII, 32-bit units otherwise) rather than one ord() per char, and
+        # with prefix sums P_k: sum((i + 1) * c_i) == (n + 1) * P_n - sum(P_k),
+        # so the whole kernel is three C-level reductions.
+        if s.isascii():
+            codepoints = s.encode('ascii')
+        else:
+            codepoints = memoryview(s.encode(_UTF32, 'surrogatepass')).cast('I')
+        return (len(codepoints) + 1) * sum(codepoints) - sum(accumulate(codepoints))
     
     # ------------------------------------------------------------------
     # Evolving τ, ω, δ, ε, η, κ, ζ
     # ------------------------------------------------------------------
     
     def _speak(self, old_tau, external_input):
-        combined = []
-        a = list(old_tau)
-        b = list(external_input)
-        while a or b:
-            if a:
-                combined.append(a.pop(0))
-            if b:
-                combined.append(b.pop(0))
-        return "T" + "".join(combined)
+        # Interleave the overlap with the input (map stops at the shorter
+        # side), then append whatever is left of the longer one.
+        n = min(len(old_tau), len(external_input))
+        woven = "".join(map(operator.add, old_tau, external_input))
+        return "T" + woven + old_tau[n:] + external_input[n:]
     
     def _fracture(self, old_omega, external_input):
         half = len(old_omega) // 2
-        part1 = old_omega[:half]
-        part2 = old_omega[half:]
-        cracked = part1 + "|" + part2
-        
-        shards = []
-        c = list(external_input)
-        d = list(cracked)
-        while c or d:
-            if d:
-                shards.append(d.pop(0))
-            if c:
-                shards.append('-'+c.pop(0)+'-')
-        return "".join(shards)
+        cracked = f"{old_omega[:half]}|{old_omega[half:]}"
+        
+        # Same shape as _speak: each input char becomes a "-c-" shard after
+        # its ω char; leftover input shards or ω chars follow the overlap.
+        n = min(len(cracked), len(external_input))
+        woven = "".join(map("{}-{}-".format, cracked, external_input))
+        return woven + cracked[n:] + "".join(map("-{}-".format, external_input[n:]))
     
     def _fold_delta(self, old_delta, external_input):
         mid = len(old_delta) // 2
-        left = old_delta[:mid]
-        right = old_delta[mid:]
-        right_reversed = right[::-1]
-        return left + "(" + external_input + ")" + right_reversed
+        # old_delta[:mid-1:-1] is old_delta[mid:] reversed, in one slice;
+        # mid == 0 (at most one char) would read as [:-1:-1], so reverse whole
+        right_reversed = old_delta[:mid-1:-1] if mid else old_delta[::-1]
+        return f"{old_delta[:mid]}({external_input}){right_reversed}"
     
     def _shift_entropy(self, old_epsilon, external_input):
         mix = old_epsilon + external_input
@@ -298,14 +280,14 @@ class SymphonicPhiSystem:
         return fused + "→"
     
     def _child_of_delta(self, new_delta):
-        alt = new_delta[::2]
-        return "K" + alt[::-1]
+        # Even indices of δ, last one first, in a single stride
+        start = -1 if len(new_delta) % 2 else -2
+        return "K" + new_delta[start::-2]
     
     def _child_of_eta(self, new_eta):
-        if '→' in new_eta:
-            core = new_eta.split('→')[0]
-        else:
-            core = new_eta
+        # η up to its first arrow (all of it if there is none), reversed
+        idx = new_eta.find('→')
+        core = new_eta[:idx] if idx >= 0 else new_eta
         return "Z" + core[::-1]
     
     # ------------------------------------------------------------------
@@ -315,30 +297,20 @@ class SymphonicPhiSystem:
     def _measure_curvature(self, new_state):
         curvature = {}
         for key in ['tau','omega','delta','epsilon','eta']:
-            old_str = self.signatures[key][-1] if self.signatures[key] else ""
+            old_str = self.signatures[key]
             new_str = new_state[key]
             diff_count = self._compare_chars(old_str, new_str)
-            curvature[key] = f"diff:{diff_count}"
+            curvature[key] = diff_count
         return curvature
     
     def _compare_chars(self, s1, s2):
-        length = max(len(s1), len(s2))
-        diff = 0
-        for i in range(length):
-            c1 = s1[i] if i < len(s1) else ''
-            c2 = s2[i] if i < len(s2) else ''
-            if c1 != c2:
-                diff += 1
-        return diff
-    
-    def _compare_state(self, s1, s2):
-        main_keys = ['tau','omega','delta','epsilon','eta','kappa','zeta']
-        for k in main_keys:
-            if k not in s1 or k not in s2:
-                return False
-            if s1[k] != s2[k]:
-                return False
-        return True
+        # η only ever appends, so its old value is a prefix of the new one;
+        # startswith settles that with one memcmp-style comparison.
+        if s2.startswith(s1):
+            return len(s2) - len(s1)
+        # Mismatches over the common prefix (map stops at the shorter
+        # string), plus one per character the longer string has extra.
+        return sum(map(operator.ne, s1, s2)) + abs(len(s1) - len(s2))
 
 
 # ----------------------------------------------------------------------
@@ -365,80 +337,51 @@ def parse_node_for_graph(node_str):
         'fold_count': 0,
         'full_node': node_str
     }
-    numeric_id = 0
-    wave_omega = 0
-    curv_sum   = 0
-    kappa_sum  = 0
-    fold_count = 0
     
-    # parse numeric ID after 'n'
+    # Well-formed nodes: one match
+    m = _NODE_RE.fullmatch(node_str)
+    if m:
+        # _int_or_zero, not int(): an empty ID or a field past the
+        # int-from-string digit limit reads as 0 instead of raising
+        result['numeric_id'] = _int_or_zero(m.group('id'))
+        if m.group('fold') is not None:
+            result['wave_omega'] = _int_or_zero(m.group('omega'))
+            result['curv_sum']   = _int_or_zero(m.group('curv'))
+            result['kappa_sum']  = _int_or_zero(m.group('kappa'))
+            result['fold_count'] = _int_or_zero(m.group('fold'))
+        return result
+    
+    # Anything else: scan field by field so a partial node keeps the
+    # fields it has
+    head, pipe, wave_part = node_str.partition('|')
     if node_str.startswith('n'):
-        after_n = node_str[1:]
-        pipe_idx = after_n.find('|')
-        if pipe_idx >= 0:
-            id_part = after_n[:pipe_idx]
-        else:
-            # check '@'
-            at_idx = after_n.find('@')
-            if at_idx >= 0:
-                id_part = after_n[:at_idx]
-            else:
-                id_part = after_n
-        try:
-            numeric_id = int(id_part)
-        except:
-            numeric_id = 0
-    
-    # parse wave part => 'W-..C-..K-..F-..'
-    if '|' in node_str:
-        parts = node_str.split('|',1)
-        wave_part = parts[1]
-        if '@alpay.md' in wave_part:
-            wave_part = wave_part.replace('@alpay.md','')
-        
-        # remove leading 'W-'
-        if wave_part.startswith('W-'):
-            wave_part = wave_part[2:]
-        
-        c_idx = wave_part.find('C-')
-        if c_idx != -1:
-            w_str = wave_part[:c_idx]
-            try:
-                wave_omega = int(w_str)
-            except:
-                wave_omega = 0
-            wave_part = wave_part[c_idx+2:]
-        
-        k_idx = wave_part.find('K-')
-        if k_idx != -1:
-            c_str = wave_part[:k_idx]
-            try:
-                curv_sum = int(c_str)
-            except:
-                curv_sum = 0
-            wave_part = wave_part[k_idx+2:]
-        
-        f_idx = wave_part.find('F-')
-        if f_idx != -1:
-            k_str = wave_part[:f_idx]
-            try:
-                kappa_sum = int(k_str)
-            except:
-                kappa_sum = 0
-            wave_part = wave_part[f_idx+2:]
-            try:
-                fold_count = int(wave_part)
-            except:
-                fold_count = 0
-    
-    result['numeric_id'] = numeric_id
-    result['wave_omega'] = wave_omega
-    result['curv_sum']   = curv_sum
-    result['kappa_sum']  = kappa_sum
-    result['fold_count'] = fold_count
+        # ID runs up to the pipe, or else up to the domain
+        id_part = head[1:] if pipe else node_str[1:].split('@', 1)[0]
+        result['numeric_id'] = _int_or_zero(id_part)
+    
+    # W-<omega>C-<curv>K-<kappa>F-<fold>: each marker closes the field
+    # before it, F- also opens the fold count
+    wave_part = wave_part.replace('@alpay.md', '')
+    if wave_part.startswith('W-'):
+        wave_part = wave_part[2:]
+    for key, marker in (('wave_omega', 'C-'), ('curv_sum', 'K-'), ('kappa_sum', 'F-')):
+        idx = wave_part.find(marker)
+        if idx == -1:
+            continue
+        result[key] = _int_or_zero(wave_part[:idx])
+        wave_part = wave_part[idx+2:]
+        if marker == 'F-':
+            result['fold_count'] = _int_or_zero(wave_part)
     return result
 
 
+def _int_or_zero(text):
+    try:
+        return int(text)
+    except ValueError:
+        return 0
+
+
 def run_graph(node_list):
     """
     For each pair (i < j) in node_list, parse, compute:
@@ -462,26 +405,24 @@ def run_graph(node_list):
         print("Need at least 2 nodes to compare.")
         return
     
-    for i in range(len(parsed)):
-        for j in range(i+1, len(parsed)):
-            A = parsed[i]
-            B = parsed[j]
-            
-            id_delta = abs(A['numeric_id'] - B['numeric_id'])
-            wave_delta = abs(A['wave_omega'] - B['wave_omega'])
-            curv_delta = abs(A['curv_sum'] - B['curv_sum'])
-            kapp_delta = abs(A['kappa_sum'] - B['kappa_sum'])
-            fold_delta = abs(A['fold_count'] - B['fold_count'])
-            
-            drift = id_delta + wave_delta + curv_delta + kapp_delta + fold_delta
-            if drift < 100:
-                drift_label = "Minimal"
-            elif drift < 1000:
-                drift_label = "Moderate"
-            else:
-                drift_label = "High"
-            
-            print(f"({i+1} vs {j+1}) => ID Δ:{id_delta}, ω Δ:{wave_delta}, C Δ:{curv_delta}, κ Δ:{kapp_delta}, Fold Δ:{fold_delta} => Drift: {drift_label}")
+    # Pull the compared fields out once per node, not once per pair
+    fields = [(i, p['numeric_id'], p['wave_omega'], p['curv_sum'], p['kappa_sum'], p['fold_count'])
+              for i, p in enumerate(parsed, 1)]
+    
+    lines = []
+    for (i, *A), (j, *B) in combinations(fields, 2):
+        id_delta, wave_delta, curv_delta, kapp_delta, fold_delta = map(abs, map(operator.sub, A, B))
+        
+        drift = id_delta + wave_delta + curv_delta + kapp_delta + fold_delta
+        if drift < 100:
+            drift_label = "Minimal"
+        elif drift < 1000:
+            drift_label = "Moderate"
+        else:
+            drift_label = "High"
+        
+        lines.append(f"({i} vs {j}) => ID Δ:{id_delta}, ω Δ:{wave_delta}, C Δ:{curv_delta}, κ Δ:{kapp_delta}, Fold Δ:{fold_delta} => Drift: {drift_label}\n")
+    sys.stdout.write("".join(lines))
     
     print("=== End Graph ===")
 
@@ -538,7 +479,7 @@ def run_generate(verbose=False, resume=None, email_only=False):
             print(f"  {k}: {res['fold_signatures'][k]}")
         print("\nCurvature:")
         for k, v in res['curvature'].items():
-            print(f"  {k}: {v}")
+            print(f"  {k}: diff:{v}")
     
     # Show final node
     if email_only:
@@ -558,6 +499,10 @@ def run_generate(verbose=False, resume=None, email_only=False):
     print("=== End ===")
 
 
+# Fold rows buffered per write in run_test
+_TEST_OUTPUT_BATCH = 1000
+
+
 def run_test(iterations=10, verbose=False, resume=None, test_email=False, email_only=False):
     """
     Run multiple folds with identical input, checking for collisions.
@@ -586,10 +531,12 @@ def run_test(iterations=10, verbose=False, resume=None, test_email=False, email_
     generated_nodes = set()
     static_input = "TEST"
     
-    email_pattern = re.compile(r"^n\d+@alpay\.md$")
     all_count = 0
     pure_email_count = 0
     
+    # Rows are written in batches rather than one print() per fold
+    lines = []
+    
     for i in range(1, iterations+1):
         res = phi.fold(static_input)
         
@@ -598,23 +545,29 @@ def run_test(iterations=10, verbose=False, resume=None, test_email=False, email_
         public_node   = res['public_node']
         
         if internal_node in generated_nodes:
+            if lines:
+                print("\n".join(lines))
             print(f"\nCOLLISION at fold {i}: {internal_node}")
             raise AssertionError("Collision detected — φ has failed!")
         generated_nodes.add(internal_node)
         
         # Email stats
         all_count += 1
-        if email_pattern.match(public_node):
+        # n<digits>@alpay.md, checked without a regex match per fold
+        if (public_node.startswith('n') and public_node.endswith('@alpay.md')
+                and public_node[1:-9].isdecimal()):
             pure_email_count += 1
         
         # Display logic
         if verbose and 'debug_info' in res:
             dbg = res['debug_info']
-            curv_str = ",".join(f"{k}:{v}" for k,v in res['curvature'].items())
+            c = res['curvature']
+            curv_str = (f"tau:diff:{c['tau']},omega:diff:{c['omega']},delta:diff:{c['delta']},"
+                        f"epsilon:diff:{c['epsilon']},eta:diff:{c['eta']}")
             # We can show the internal node or public address here
             # If email_only => show public, else show internal
             shown_node = public_node if email_only else internal_node
-            print(f"{i:<6} {shown_node:<28} {curv_str:<15} {dbg['digit_count']}")
+            lines.append(f"{i:<6} {shown_node:<28} {curv_str:<15} {dbg['digit_count']}")
         else:
             # not verbose
             if email_only:
@@ -624,8 +577,14 @@ def run_test(iterations=10, verbose=False, resume=None, test_email=False, email_
                 # show internal
                 shown_node = internal_node
             
-            print(f"{i:<6} {shown_node:<60}")
+            lines.append(f"{i:<6} {shown_node:<60}")
+        
+        if len(lines) >= _TEST_OUTPUT_BATCH:
+            print("\n".join(lines))
+            lines.clear()
     
+    if lines:
+        print("\n".join(lines))
     print("-"*70)
     print(f"SUCCESS! {iterations} unique nodes generated from identical input.")
     